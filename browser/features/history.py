@@ -1,14 +1,24 @@
 import json
+import heapq
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from PyQt5.QtCore import QObject, pyqtSignal, QSettings
 from ..utils.constants import APP_NAME, APP_ORGANIZATION, MAX_HISTORY_ITEMS
+from ..utils.helpers import json_dumps, json_loads
 
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=MAX_HISTORY_ITEMS)
+def _parse_iso(timestamp):
+    return datetime.fromisoformat(timestamp)
+
+
 class HistoryEntry:
+    __slots__ = ('url', 'title', 'visit_count', 'last_visit')
+
     def __init__(self, url, title, visit_count=1, last_visit=None):
         self.url = url
         self.title = title
@@ -60,7 +70,7 @@ class HistoryManager(QObject):
         data = self.settings.value("history/data", "")
         if data:
             try:
-                items = json.loads(data)
+                items = json_loads(data)
                 for item in items:
                     entry = HistoryEntry.from_dict(item)
                     self._entries[entry.url] = entry
@@ -71,7 +81,7 @@ class HistoryManager(QObject):
         entries = sorted(self._entries.values(), key=lambda e: e.last_visit, reverse=True)
         entries = entries[:MAX_HISTORY_ITEMS]
         data = [e.to_dict() for e in entries]
-        self.settings.setValue("history/data", json.dumps(data, ensure_ascii=False))
+        self.settings.setValue("history/data", json_dumps(data))
 
     def add_entry(self, url, title):
         if not url or url in ('about:blank', ''):
@@ -107,7 +117,7 @@ class HistoryManager(QObject):
         return entries
 
     def get_recent_entries(self, limit=50):
-        return self.get_all_entries()[:limit]
+        return heapq.nlargest(limit, self._entries.values(), key=lambda e: e.last_visit)
 
     def search_history(self, query):
         q = query.lower()
@@ -119,9 +129,7 @@ class HistoryManager(QObject):
         return results
 
     def get_most_visited(self, limit=10):
-        entries = list(self._entries.values())
-        entries.sort(key=lambda e: e.visit_count, reverse=True)
-        return entries[:limit]
+        return heapq.nlargest(limit, self._entries.values(), key=lambda e: e.visit_count)
 
     def get_entries_by_date(self, start_date, end_date=None):
         if end_date is None:
@@ -129,7 +137,7 @@ class HistoryManager(QObject):
         results = []
         for entry in self._entries.values():
             try:
-                visit_time = datetime.fromisoformat(entry.last_visit)
+                visit_time = _parse_iso(entry.last_visit)
                 if start_date <= visit_time <= end_date:
                     results.append(entry)
             except (ValueError, TypeError):
@@ -168,7 +176,7 @@ class HistoryManager(QObject):
         to_remove = []
         for url, entry in self._entries.items():
             try:
-                visit_time = datetime.fromisoformat(entry.last_visit)
+                visit_time = _parse_iso(entry.last_visit)
                 if visit_time >= cutoff:
                     to_remove.append(url)
             except (ValueError, TypeError):
@@ -184,11 +192,11 @@ class HistoryManager(QObject):
     def export_history(self, filepath):
         data = [e.to_dict() for e in self.get_all_entries()]
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write(json_dumps(data, indent=True))
 
     def import_history(self, filepath):
         with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = json_loads(f.read())
         count = 0
         for item in data:
             entry = HistoryEntry.from_dict(item)
@@ -2,31 +2,139 @@ import json
 import os
 import base64
 import hashlib
+import hmac
 import secrets
+import string
 import logging
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
-from cryptography.fernet import Fernet, InvalidToken
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from PyQt5.QtCore import QObject, pyqtSignal, QSettings
+from PyQt5.QtCore import QObject, pyqtSignal, QSettings, QTimer, QCoreApplication
 from ..utils.constants import APP_NAME, APP_ORGANIZATION
-from ..utils.helpers import extract_domain
+from ..utils.helpers import extract_domain, json_dumps, json_loads
+
+try:
+    import rfernet
+except ImportError:
+    rfernet = None
 
 log = logging.getLogger(__name__)
 
+# cryptography pulls in CFFI and the OpenSSL bindings, so it is only
+# imported once a master password is actually used
+_fernet_module = None
+
+
+def _crypto():
+    global _fernet_module
+    if _fernet_module is None:
+        from cryptography import fernet
+        _fernet_module = fernet
+    return _fernet_module
+
+
+_PWD_CHARS = (string.ascii_letters + string.digits + string.punctuation).encode('ascii')
+# Map every byte onto the alphabet and drop bytes at or above the largest
+# multiple of its size, so bytes.translate samples it without modulo bias
+_PWD_TABLE = bytes(_PWD_CHARS[i % len(_PWD_CHARS)] for i in range(256))
+_PWD_REJECT = bytes(range(256 - 256 % len(_PWD_CHARS), 256))
+# One bit per required character class: upper, lower, digit, punctuation
+_PWD_CLASS_BITS = bytes(
+    1 if chr(b) in string.ascii_uppercase else
+    2 if chr(b) in string.ascii_lowercase else
+    4 if chr(b) in string.digits else
+    8 if chr(b) in string.punctuation else 0
+    for b in range(256)
+)
+
+
+_iso_second = None
+_iso_text = ""
+
+
+def _now_iso():
+    """Current local time in ISO format, formatted at most once per second."""
+    global _iso_second, _iso_text
+    now = int(time.time())
+    if now != _iso_second:
+        _iso_second = now
+        _iso_text = datetime.fromtimestamp(now).isoformat()
+    return _iso_text
+
+
+class _RustFernet:
+    """rfernet wrapper exposing the bytes API of cryptography's Fernet."""
+
+    __slots__ = ('_impl',)
+
+    def __init__(self, key):
+        self._impl = rfernet.Fernet(key.decode())
+
+    def encrypt(self, data):
+        return self._impl.encrypt(data).encode()
+
+    def decrypt(self, token):
+        try:
+            return self._impl.decrypt(token.decode())
+        except rfernet.DecryptionError as e:
+            raise _crypto().InvalidToken from e
+
+
+def _make_fernet(key):
+    if rfernet is not None:
+        return _RustFernet(key)
+    return _crypto().Fernet(key)
+
+
+@lru_cache(maxsize=4)
+def _derive_keys(master_password, salt):
+    """Derive the Fernet key and the verify tag as two independent PBKDF2 chains.
+
+    PBKDF2 runs a full iteration chain per 32-byte output block, so asking
+    for 64 bytes at once would cost the same as these two calls.
+
+    hashlib releases the GIL inside OpenSSL, so the verify chain runs on a
+    worker thread while the key chain runs here. Results are memoized so
+    re-unlocking within a session skips the KDF; this keeps the master
+    password in process memory until PasswordManager clears the cache.
+    """
+    password = master_password.encode()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        verify_future = pool.submit(
+            hashlib.pbkdf2_hmac, 'sha256', password, salt + b"verify", 480000, 32)
+        raw_key = hashlib.pbkdf2_hmac('sha256', password, salt, 480000, 32)
+        raw_verify = verify_future.result()
+    key = base64.urlsafe_b64encode(raw_key)
+    verify_hash = base64.urlsafe_b64encode(raw_verify).decode()
+    return key, verify_hash
+
 
 class PasswordEntry:
+    # _password holds bytes (Fernet token or UTF-8 plaintext) for PasswordManager;
+    # the public password attribute is always str, or None if decryption failed
+    __slots__ = ('id', 'domain', 'username', '_password', 'created_at', 'updated_at', 'notes')
+
     def __init__(self, domain, username, password, entry_id=None,
                  created_at=None, updated_at=None, notes=""):
         self.id = entry_id or secrets.token_hex(16)
         self.domain = domain
         self.username = username
         self.password = password
-        self.created_at = created_at or datetime.now().isoformat()
-        self.updated_at = updated_at or datetime.now().isoformat()
+        self.created_at = created_at or _now_iso()
+        self.updated_at = updated_at or self.created_at
         self.notes = notes
 
+    @property
+    def password(self):
+        return None if self._password is None else self._password.decode()
+
+    @password.setter
+    def password(self, value):
+        self._password = value.encode() if isinstance(value, str) else value
+
     def to_dict(self):
         return {
             'id': self.id, 'domain': self.domain, 'username': self.username,
@@ -64,30 +172,20 @@ class PasswordManager(QObject):
         self._initialized = True
         self.settings = QSettings(APP_ORGANIZATION, APP_NAME)
         self._passwords = {}
+        self._search_index = {}
+        self._domain_counts = Counter()
         self._fernet = None
         self._master_set = False
+        self._save_pending = False
         self._load()
-
-    def _derive_key(self, master_password, salt):
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(), length=32,
-            salt=salt, iterations=480000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(master_password.encode()))
-        return key
-
-    def _hash_master(self, master_password, salt):
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(), length=32,
-            salt=salt, iterations=480000,
-        )
-        return base64.urlsafe_b64encode(kdf.derive(master_password.encode())).decode()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush)
 
     def set_master_password(self, master_password):
         salt = os.urandom(16)
-        key = self._derive_key(master_password, salt)
-        self._fernet = Fernet(key)
-        verify_hash = self._hash_master(master_password, salt)
+        key, verify_hash = _derive_keys(master_password, salt)
+        self._fernet = _make_fernet(key)
         self.settings.setValue("passwords/salt", base64.b64encode(salt).decode())
         self.settings.setValue("passwords/verify", verify_hash)
         self._master_set = True
@@ -99,14 +197,16 @@ class PasswordManager(QObject):
         if not salt_b64 or not stored_hash:
             return False
         salt = base64.b64decode(salt_b64)
-        computed = self._hash_master(master_password, salt)
-        if computed == stored_hash:
-            key = self._derive_key(master_password, salt)
-            self._fernet = Fernet(key)
-            self._master_set = True
-            self._decrypt_all()
-            return True
-        return False
+        key, verify_hash = _derive_keys(master_password, salt)
+        if not hmac.compare_digest(verify_hash, stored_hash):
+            if not hmac.compare_digest(key.decode(), stored_hash):
+                return False
+            # Older versions stored the Fernet key itself as the verify hash
+            self.settings.setValue("passwords/verify", verify_hash)
+        self._fernet = _make_fernet(key)
+        self._master_set = True
+        self._decrypt_all()
+        return True
 
     def has_master_password(self):
         return bool(self.settings.value("passwords/salt", ""))
@@ -116,122 +216,162 @@ class PasswordManager(QObject):
 
     def _encrypt(self, text):
         if self._fernet:
-            return self._fernet.encrypt(text.encode()).decode()
-        return text
+            return self._fernet.encrypt(text.encode())
+        return text.encode()
 
-    def _decrypt(self, text):
+    def _decrypt(self, data):
         if self._fernet:
             try:
-                return self._fernet.decrypt(text.encode()).decode()
-            except InvalidToken:
+                return self._fernet.decrypt(data).decode()
+            except _crypto().InvalidToken:
                 log.warning("Şifre çözme başarısız")
                 return None
-        return text
+        return data.decode()
 
     def _re_encrypt_all(self):
+        encrypt = self._fernet.encrypt
         for entry in self._passwords.values():
-            entry.password = self._encrypt(entry.password)
+            entry._password = encrypt(entry._password)
+        # The new salt is already stored, so the re-encrypted snapshot must follow at once
         self._save()
+        self.settings.sync()
 
     def _decrypt_all(self):
+        decrypt = self._fernet.decrypt
         for entry in self._passwords.values():
-            decrypted = self._decrypt(entry.password)
-            if decrypted is not None:
-                entry.password = decrypted
+            try:
+                entry._password = decrypt(entry._password)
+            except _crypto().InvalidToken:
+                log.warning("Şifre çözme başarısız")
 
     def _load(self):
         data = self.settings.value("passwords/data", "")
         if data:
             try:
-                items = json.loads(data)
+                items = json_loads(data)
                 for item in items:
                     entry = PasswordEntry.from_dict(item)
-                    self._passwords[f"{entry.domain}:{entry.username}"] = entry
+                    self._passwords[(entry.domain, entry.username)] = entry
             except (json.JSONDecodeError, KeyError):
                 log.warning("Parola verisi okunamadı")
+        self._search_index = {
+            key: (e.domain.lower(), e.username.lower())
+            for key, e in self._passwords.items()
+        }
+        self._domain_counts = Counter(e.domain for e in self._passwords.values())
+
+    def _schedule_save(self):
+        """Coalesce single-entry edits into one snapshot on the next event-loop pass."""
+        if not self._save_pending:
+            self._save_pending = True
+            QTimer.singleShot(0, self._flush)
+
+    def _flush(self):
+        """Write a queued snapshot; also runs on aboutToQuit so a last edit is not lost."""
+        if self._save_pending:
+            self._save()
+            self.settings.sync()
 
     def _save(self):
+        self._save_pending = False
         data = [e.to_dict() for e in self._passwords.values()]
-        self.settings.setValue("passwords/data", json.dumps(data, ensure_ascii=False))
+        self.settings.setValue("passwords/data", json_dumps(data))
 
     def save_password(self, domain, username, password, notes=""):
-        key = f"{domain}:{username}"
-        stored_password = self._encrypt(password) if self._fernet else password
+        key = (domain, username)
+        existing = self._passwords.get(key)
+        # Plain byte comparison: matches entries held as plaintext (no master
+        # password, or decrypted after unlock); ciphertext just gets re-saved
+        if existing and existing.notes == notes and existing._password == password.encode():
+            return existing
+        stored_password = self._encrypt(password)
         entry = PasswordEntry(domain, username, stored_password, notes=notes)
+        if existing is None:
+            self._domain_counts[domain] += 1
         self._passwords[key] = entry
-        self._save()
+        self._search_index[key] = (domain.lower(), username.lower())
+        self._schedule_save()
         self.password_saved.emit(entry)
         self.passwords_changed.emit()
         return entry
 
     def get_password(self, domain, username=None):
         if username:
-            key = f"{domain}:{username}"
+            key = (domain, username)
             entry = self._passwords.get(key)
             if entry:
-                password = self._decrypt(entry.password) if self._fernet else entry.password
-                return password
+                return self._decrypt(entry._password)
             return None
-        results = []
-        for entry in self._passwords.values():
-            if entry.domain == domain:
-                e_copy = PasswordEntry(
-                    entry.domain, entry.username,
-                    self._decrypt(entry.password) if self._fernet else entry.password,
-                    entry_id=entry.id, created_at=entry.created_at,
-                    updated_at=entry.updated_at, notes=entry.notes,
-                )
-                results.append(e_copy)
-        return results
+        # id and timestamps are passed through, so __init__ generates nothing
+        decrypt = self._decrypt
+        return [
+            PasswordEntry(entry.domain, entry.username, decrypt(entry._password),
+                          entry_id=entry.id, created_at=entry.created_at,
+                          updated_at=entry.updated_at, notes=entry.notes)
+            for entry in self._passwords.values() if entry.domain == domain
+        ]
 
     def remove_password(self, domain, username):
-        key = f"{domain}:{username}"
+        key = (domain, username)
         if key in self._passwords:
             del self._passwords[key]
-            self._save()
+            del self._search_index[key]
+            self._domain_counts[domain] -= 1
+            if not self._domain_counts[domain]:
+                del self._domain_counts[domain]
+            self._schedule_save()
             self.password_removed.emit(domain, username)
             self.passwords_changed.emit()
             return True
         return False
 
     def update_password(self, domain, username, new_password, notes=None):
-        key = f"{domain}:{username}"
+        key = (domain, username)
         if key in self._passwords:
             entry = self._passwords[key]
-            entry.password = self._encrypt(new_password) if self._fernet else new_password
-            entry.updated_at = datetime.now().isoformat()
+            entry._password = self._encrypt(new_password)
+            entry.updated_at = _now_iso()
             if notes is not None:
                 entry.notes = notes
-            self._save()
+            self._schedule_save()
             self.passwords_changed.emit()
             return True
         return False
 
     def get_all_domains(self):
-        return list({e.domain for e in self._passwords.values()})
+        return list(self._domain_counts)
 
     def get_all_entries(self):
         return list(self._passwords.values())
 
     def search_passwords(self, query):
         q = query.lower()
-        return [e for e in self._passwords.values() if q in e.domain.lower() or q in e.username.lower()]
+        passwords = self._passwords
+        return [passwords[key] for key, (domain, username) in self._search_index.items()
+                if q in domain or q in username]
 
     def generate_password(self, length=20):
-        import string
-        chars = string.ascii_letters + string.digits + string.punctuation
         while True:
-            pwd = ''.join(secrets.choice(chars) for _ in range(length))
-            if (any(c.isupper() for c in pwd) and any(c.islower() for c in pwd)
-                    and any(c.isdigit() for c in pwd) and any(c in string.punctuation for c in pwd)):
-                return pwd
+            picked = secrets.token_bytes(length * 2).translate(_PWD_TABLE, _PWD_REJECT)
+            if len(picked) < length:
+                continue
+            pwd = picked[:length]
+            mask = 0
+            for b in pwd:
+                mask |= _PWD_CLASS_BITS[b]
+            if mask == 0b1111:
+                return pwd.decode('ascii')
 
     def get_password_count(self):
         return len(self._passwords)
 
     def clear_all(self):
         self._passwords.clear()
+        self._search_index.clear()
+        self._domain_counts.clear()
+        _derive_keys.cache_clear()
         self._save()
+        self.settings.sync()
         self.passwords_changed.emit()
 
     def change_master_password(self, old_password, new_password):
@@ -239,11 +379,12 @@ class PasswordManager(QObject):
             return False
         decrypted = {}
         for key, entry in self._passwords.items():
-            pwd = self._decrypt(entry.password)
+            pwd = self._decrypt(entry._password)
             if pwd is None:
                 return False
             decrypted[key] = pwd
         for key in decrypted:
-            self._passwords[key].password = decrypted[key]
+            self._passwords[key]._password = decrypted[key].encode()
         self.set_master_password(new_password)
+        _derive_keys.cache_clear()
         return True
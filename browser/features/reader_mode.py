@@ -1,5 +1,7 @@
 import html
+import re
 import logging
+from string import Template
 
 from PyQt5.QtCore import QObject, pyqtSignal
 
@@ -48,6 +50,107 @@ EXTRACT_CONTENT_JS = r'''
 '''
 
 
+_READER_COLORS = {
+    False: {'bg': '#fefefe', 'fg': '#2d2d2d', 'accent': '#4a90d9', 'link': '#2563eb',
+            'border_color': '#e0e0e0', 'code_bg': '#f5f5f5'},
+    True: {'bg': '#1a1a2e', 'fg': '#e0e0e0', 'accent': '#7c83ff', 'link': '#9db4ff',
+           'border_color': '#333', 'code_bg': '#2d2d44'},
+}
+
+_READER_CSS = Template(re.sub(r'\s+', ' ', '''
+    * { margin: 0; padding: 0; box-sizing: border-box; }
+    body {
+        background-color: $bg;
+        color: $fg;
+        font-family: 'Georgia', 'Palatino', 'Times New Roman', serif;
+        font-size: 19px;
+        line-height: 1.8;
+        max-width: 680px;
+        margin: 0 auto;
+        padding: 48px 24px;
+    }
+    h1 {
+        font-family: 'Segoe UI', system-ui, sans-serif;
+        font-size: 32px;
+        line-height: 1.3;
+        margin-bottom: 8px;
+        color: $fg;
+    }
+    .author {
+        color: $accent;
+        font-size: 15px;
+        margin-bottom: 32px;
+        font-style: italic;
+    }
+    p { margin-bottom: 1.2em; }
+    a { color: $link; text-decoration: none; border-bottom: 1px solid transparent; }
+    a:hover { border-bottom-color: $link; }
+    img { max-width: 100%; height: auto; border-radius: 8px; margin: 16px 0; }
+    blockquote {
+        border-left: 3px solid $accent;
+        padding-left: 16px;
+        margin: 16px 0;
+        font-style: italic;
+        opacity: 0.85;
+    }
+    code {
+        background: $code_bg;
+        padding: 2px 6px;
+        border-radius: 4px;
+        font-size: 0.9em;
+    }
+    pre {
+        background: $code_bg;
+        padding: 16px;
+        border-radius: 8px;
+        overflow-x: auto;
+        margin: 16px 0;
+    }
+    pre code { background: none; padding: 0; }
+    hr { border: none; border-top: 1px solid $border_color; margin: 32px 0; }
+    .reader-toolbar {
+        position: fixed;
+        top: 16px;
+        right: 16px;
+        display: flex;
+        gap: 8px;
+    }
+    .reader-btn {
+        background: $code_bg;
+        border: 1px solid $border_color;
+        color: $fg;
+        padding: 8px 12px;
+        border-radius: 8px;
+        cursor: pointer;
+        font-size: 14px;
+    }
+    .reader-btn:hover { background: $accent; color: #fff; }
+''').strip())
+
+# The stylesheet only depends on the theme, so both variants are rendered once
+_READER_STYLES = {mode: _READER_CSS.substitute(colors) for mode, colors in _READER_COLORS.items()}
+
+_READER_PAGE = Template('''<!DOCTYPE html>
+<html lang="tr">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>$title</title>
+<style>$css</style>
+</head>
+<body>
+<div class="reader-toolbar">
+    <button class="reader-btn" onclick="document.body.style.fontSize=parseFloat(getComputedStyle(document.body).fontSize)+2+'px'">A+</button>
+    <button class="reader-btn" onclick="document.body.style.fontSize=parseFloat(getComputedStyle(document.body).fontSize)-2+'px'">A-</button>
+</div>
+<h1>$title</h1>
+$author_html
+<hr>
+$content
+</body>
+</html>''')
+
+
 class ReaderMode(QObject):
     mode_changed = pyqtSignal(bool)
 
@@ -101,102 +204,11 @@ class ReaderMode(QObject):
         self.mode_changed.emit(False)
 
     def _build_reader_html(self, content, title, author, dark_mode):
-        bg = '#1a1a2e' if dark_mode else '#fefefe'
-        fg = '#e0e0e0' if dark_mode else '#2d2d2d'
-        accent = '#7c83ff' if dark_mode else '#4a90d9'
-        link = '#9db4ff' if dark_mode else '#2563eb'
-        border_color = '#333' if dark_mode else '#e0e0e0'
-        code_bg = '#2d2d44' if dark_mode else '#f5f5f5'
-
         author_html = f'<p class="author">{author}</p>' if author else ''
-
-        return f'''<!DOCTYPE html>
-<html lang="tr">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>{title}</title>
-<style>
-    * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-    body {{
-        background-color: {bg};
-        color: {fg};
-        font-family: 'Georgia', 'Palatino', 'Times New Roman', serif;
-        font-size: 19px;
-        line-height: 1.8;
-        max-width: 680px;
-        margin: 0 auto;
-        padding: 48px 24px;
-    }}
-    h1 {{
-        font-family: 'Segoe UI', system-ui, sans-serif;
-        font-size: 32px;
-        line-height: 1.3;
-        margin-bottom: 8px;
-        color: {fg};
-    }}
-    .author {{
-        color: {accent};
-        font-size: 15px;
-        margin-bottom: 32px;
-        font-style: italic;
-    }}
-    p {{ margin-bottom: 1.2em; }}
-    a {{ color: {link}; text-decoration: none; border-bottom: 1px solid transparent; }}
-    a:hover {{ border-bottom-color: {link}; }}
-    img {{ max-width: 100%; height: auto; border-radius: 8px; margin: 16px 0; }}
-    blockquote {{
-        border-left: 3px solid {accent};
-        padding-left: 16px;
-        margin: 16px 0;
-        font-style: italic;
-        opacity: 0.85;
-    }}
-    code {{
-        background: {code_bg};
-        padding: 2px 6px;
-        border-radius: 4px;
-        font-size: 0.9em;
-    }}
-    pre {{
-        background: {code_bg};
-        padding: 16px;
-        border-radius: 8px;
-        overflow-x: auto;
-        margin: 16px 0;
-    }}
-    pre code {{ background: none; padding: 0; }}
-    hr {{ border: none; border-top: 1px solid {border_color}; margin: 32px 0; }}
-    .reader-toolbar {{
-        position: fixed;
-        top: 16px;
-        right: 16px;
-        display: flex;
-        gap: 8px;
-    }}
-    .reader-btn {{
-        background: {code_bg};
-        border: 1px solid {border_color};
-        color: {fg};
-        padding: 8px 12px;
-        border-radius: 8px;
-        cursor: pointer;
-        font-size: 14px;
-    }}
-    .reader-btn:hover {{ background: {accent}; color: #fff; }}
-</style>
-</head>
-<body>
-<div class="reader-toolbar">
-    <button class="reader-btn" onclick="document.body.style.fontSize=parseFloat(getComputedStyle(document.body).fontSize)+2+'px'">A+</button>
-    <button class="reader-btn" onclick="document.body.style.fontSize=parseFloat(getComputedStyle(document.body).fontSize)-2+'px'">A-</button>
-</div>
-<h1>{title}</h1>
-{author_html}
-<hr>
-{content}
-</body>
-</html>'''
+        return _READER_PAGE.substitute(
+            css=_READER_STYLES[bool(dark_mode)], title=title,
+            author_html=author_html, content=content,
+        )
 
     def set_font_size(self, size):
         if self._tab and self._active:
@@ -1,21 +1,71 @@
 import logging
-
-from PyQt5.QtCore import QObject, pyqtSignal, QSettings
+import os
+import re
+import threading
+from types import MappingProxyType
+from functools import lru_cache
+
+from PyQt5.QtCore import (QObject, pyqtSignal, QSettings, QStandardPaths, QTimer,
+                          QCoreApplication)
 from ..utils.constants import APP_NAME, APP_ORGANIZATION, SEARCH_ENGINES, DEFAULT_SEARCH_ENGINE
-from ..utils.helpers import normalize_url, url_encode
+from ..utils.helpers import normalize_url, url_encode, json_dumps, json_loads
 
 log = logging.getLogger(__name__)
 
+_singleton_lock = threading.Lock()
+
+_URL_SCHEME_RE = re.compile(r'^[a-z][a-z0-9+\-.]*://', re.I)
+_BANG_RE = re.compile(r'^(![a-z]{1,3})\s+(.*)$', re.I | re.S)
+
+# One (search template, bang) record per engine. Only the SEARCH_ENGINES
+# names are offered as default engines; Wikipedia and YouTube are bang-only
+_ENGINES = {
+    'Google': (SEARCH_ENGINES['Google'], '!g'),
+    'DuckDuckGo': (SEARCH_ENGINES['DuckDuckGo'], '!d'),
+    'Bing': (SEARCH_ENGINES['Bing'], '!b'),
+    'Yahoo': (SEARCH_ENGINES['Yahoo'], None),
+    'Yandex': (SEARCH_ENGINES['Yandex'], '!y'),
+    'Ecosia': (SEARCH_ENGINES['Ecosia'], None),
+    'Brave': (SEARCH_ENGINES['Brave'], None),
+    'Wikipedia': ('https://en.wikipedia.org/w/index.php?search={}', '!w'),
+    'YouTube': ('https://www.youtube.com/results?search_query={}', '!yt'),
+}
+
+
+def _split_template(template):
+    prefix, _, suffix = template.partition('{}')
+    return prefix, suffix
+
+
+_BANG_TO_ENGINE = {bang: name for name, (_, bang) in _ENGINES.items() if bang}
+# Templates are pre-split around their '{}' placeholder so building a URL
+# is a plain concatenation
+_ENGINE_SPLIT = {name: _split_template(template) for name, (template, _) in _ENGINES.items()}
+
+
+@lru_cache(maxsize=512)
+def _build_search_url(query, prefix, suffix):
+    return prefix + url_encode(query) + suffix
+
+
+def _needs_strip(text):
+    return text and (text[0].isspace() or text[-1].isspace())
+
 
 class SearchManager(QObject):
     _instance = None
 
     search_engine_changed = pyqtSignal(str)
 
+    BANG_COMMANDS = _BANG_TO_ENGINE
+
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            with _singleton_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
 
     def __init__(self):
@@ -23,91 +73,144 @@ class SearchManager(QObject):
             return
         super().__init__()
         self._initialized = True
-        self.settings = QSettings(APP_ORGANIZATION, APP_NAME)
+        self.settings = self._open_settings()
         self._custom_engines = {}
+        self._custom_split = {}
+        self._dirty = False
+        self._flush_scheduled = False
         self._load_custom_engines()
-
-        self.BANG_COMMANDS = {
-            '!g': 'Google', '!d': 'DuckDuckGo', '!b': 'Bing',
-            '!y': 'Yandex', '!w': 'Wikipedia', '!yt': 'YouTube',
-        }
+        self._merged_engines = dict(SEARCH_ENGINES)
+        self._merged_engines.update(self._custom_engines)
+        self._engines_view = MappingProxyType(self._merged_engines)
+        self._current_engine = self.settings.value("search/engine", DEFAULT_SEARCH_ENGINE)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush)
+
+    @staticmethod
+    def _open_settings():
+        """Keep search settings in a flat INI file instead of the native store (the registry on Windows)."""
+        config_dir = QStandardPaths.writableLocation(QStandardPaths.AppConfigLocation)
+        os.makedirs(config_dir, exist_ok=True)
+        settings = QSettings(os.path.join(config_dir, "search.ini"), QSettings.IniFormat)
+        if not settings.value("search/migrated", False, type=bool):
+            legacy = QSettings(APP_ORGANIZATION, APP_NAME)
+            for key in ("search/engine", "search/custom_engines"):
+                if legacy.contains(key):
+                    settings.setValue(key, legacy.value(key))
+            settings.setValue("search/migrated", True)
+        return settings
 
     def _load_custom_engines(self):
-        import json
         data = self.settings.value("search/custom_engines", "")
-        if data:
+        if not data or not isinstance(data, str):
+            self._custom_engines = {}
+        else:
             try:
-                self._custom_engines = json.loads(data)
-            except (json.JSONDecodeError, ValueError):
-                self._custom_engines = {}
+                engines = json_loads(data)
+            except (ValueError, TypeError):
+                log.warning("Özel arama motorları okunamadı")
+                engines = {}
+            if not isinstance(engines, dict):
+                engines = {}
+            for name, tpl in list(engines.items()):
+                if not isinstance(tpl, str):
+                    log.warning("Geçersiz özel arama motoru atlandı: %r", name)
+                    del engines[name]
+            self._custom_engines = engines
+        self._custom_split = {name: _split_template(tpl)
+                              for name, tpl in self._custom_engines.items()}
 
     def _save_custom_engines(self):
-        import json
-        self.settings.setValue("search/custom_engines", json.dumps(self._custom_engines))
+        self._dirty = True
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(250, self._flush)
+
+    def _flush(self):
+        self._flush_scheduled = False
+        if not self._dirty:
+            return
+        self._dirty = False
+        self.settings.setValue("search/custom_engines", json_dumps(self._custom_engines))
+        self.settings.sync()
 
     @property
     def current_engine(self):
-        return self.settings.value("search/engine", DEFAULT_SEARCH_ENGINE)
+        return self._current_engine
 
     @current_engine.setter
     def current_engine(self, name):
+        if name == self._current_engine:
+            return
         if name in SEARCH_ENGINES or name in self._custom_engines:
+            self._current_engine = name
             self.settings.setValue("search/engine", name)
             self.search_engine_changed.emit(name)
 
+    def _resolve_template(self, engine_name):
+        return (_ENGINE_SPLIT.get(engine_name) or self._custom_split.get(engine_name)
+                or _ENGINE_SPLIT.get(DEFAULT_SEARCH_ENGINE, ('', '')))
+
     def get_search_url(self, query, engine=None):
-        engine = engine or self.current_engine
-        template = SEARCH_ENGINES.get(engine) or self._custom_engines.get(engine)
-        if template:
-            encoded = url_encode(query)
-            return template.replace('{}', encoded)
-        default_template = SEARCH_ENGINES.get(DEFAULT_SEARCH_ENGINE, '')
-        return default_template.replace('{}', url_encode(query))
+        prefix, suffix = self._resolve_template(engine or self._current_engine)
+        return _build_search_url(query, prefix, suffix)
 
     def process_input(self, text):
-        text = text.strip()
+        if _needs_strip(text):
+            text = text.strip()
         if not text:
             return None, False
 
-        for bang, engine in self.BANG_COMMANDS.items():
-            if text.startswith(bang + ' '):
-                query = text[len(bang) + 1:].strip()
+        m = _BANG_RE.match(text) if text[0] == '!' else None
+        if m:
+            engine = self.BANG_COMMANDS.get(m.group(1).lower())
+            if engine:
+                query = m.group(2).strip()
                 if query:
                     return self.get_search_url(query, engine), True
                 return None, False
 
-        normalized = normalize_url(text)
+        # Text that already carries a scheme (chrome://gpu, foo://bar) is used as is
+        if _URL_SCHEME_RE.match(text) and ' ' not in text:
+            return text, False
         if self._looks_like_url(text):
-            return normalized, False
+            normalized = normalize_url(text)
+            if normalized:
+                return normalized, False
 
         return self.get_search_url(text), True
 
     def _looks_like_url(self, text):
         if text.startswith(('http://', 'https://', 'ftp://', 'file://')):
             return True
-        if '.' in text and ' ' not in text:
-            parts = text.split('.')
-            if len(parts) >= 2 and len(parts[-1]) >= 2:
+        if ' ' not in text:
+            dot = text.rfind('.')
+            if dot != -1 and len(text) - dot > 2:
                 return True
-        if text.startswith('localhost') or text.startswith('127.') or text.startswith('[::1]'):
-            return True
-        return False
+        return text.startswith(('localhost', '127.', '[::1]'))
 
     def get_available_engines(self):
-        engines = dict(SEARCH_ENGINES)
-        engines.update(self._custom_engines)
-        return engines
+        """Read-only live view of built-in and custom engines; copy with dict() to modify."""
+        return self._engines_view
 
     def add_custom_engine(self, name, url_template):
         if '{}' not in url_template:
             return False
         self._custom_engines[name] = url_template
+        self._custom_split[name] = _split_template(url_template)
+        self._merged_engines[name] = url_template
         self._save_custom_engines()
         return True
 
     def remove_custom_engine(self, name):
         if name in self._custom_engines:
             del self._custom_engines[name]
+            del self._custom_split[name]
+            if name in SEARCH_ENGINES:
+                self._merged_engines[name] = SEARCH_ENGINES[name]
+            else:
+                del self._merged_engines[name]
             self._save_custom_engines()
             if self.current_engine == name:
                 self.current_engine = DEFAULT_SEARCH_ENGINE
@@ -1,127 +1,226 @@
+from functools import lru_cache
+from string import Template
+
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QLineEdit, QPushButton, QComboBox, QCheckBox,
                              QTabWidget, QWidget, QFormLayout,
-                             QGroupBox, QFileDialog, QFrame, QToolButton)
-from PyQt5.QtCore import Qt, pyqtSignal, QSize
-from PyQt5.QtGui import QFont
+                             QGroupBox, QFileDialog, QToolButton)
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QSize, QTimer
+from PyQt5.QtGui import QFont, QStandardItem, QStandardItemModel
 from ..utils.constants import (LIGHT_THEME, DARK_THEME, SEARCH_ENGINES,
-                               SUPPORTED_LANGUAGES, APP_NAME, APP_VERSION)
-from ..utils.helpers import load_icon, load_themed_icon
-from ..utils.i18n import _ as tr, get_available_languages
+                               APP_NAME, APP_VERSION)
+from ..utils.helpers import load_themed_icon
+from ..utils.i18n import _ as tr, N_, get_available_languages, get_current_language
+
+
+_QSS_TEMPLATE = Template("""
+    $dialog {
+        background-color: $bg_primary;
+        color: $text_primary;
+        font-family: 'Segoe UI', system-ui, sans-serif;
+    }
+    $dialog QLabel {
+        color: $text_primary;
+    }
+    $dialog QLineEdit, $dialog QTextEdit, $dialog QComboBox, $dialog QSpinBox {
+        background-color: $bg_secondary;
+        border: 1px solid $border;
+        border-radius: 8px;
+        padding: 8px 12px;
+        color: $text_primary;
+        font-size: 13px;
+    }
+    $dialog QLineEdit:focus, $dialog QTextEdit:focus {
+        border-color: $accent;
+    }
+    $dialog QPushButton {
+        background-color: $bg_tertiary;
+        border: 1px solid $border;
+        border-radius: 8px;
+        padding: 8px 20px;
+        color: $text_primary;
+        min-width: 80px;
+        font-size: 13px;
+    }
+    $dialog QPushButton:hover {
+        background-color: $accent;
+        color: white;
+        border-color: $accent;
+    }
+    $dialog QPushButton:pressed {
+        background-color: $accent_hover;
+    }
+    $dialog QPushButton#primaryBtn {
+        background-color: $accent;
+        color: white;
+        border-color: $accent;
+    }
+    $dialog QPushButton#primaryBtn:hover {
+        background-color: $accent_hover;
+    }
+    $dialog QPushButton#dangerBtn {
+        background-color: $error;
+        color: white;
+        border-color: $error;
+    }
+    $dialog QGroupBox {
+        border: 1px solid $border;
+        border-radius: 10px;
+        margin-top: 18px;
+        padding: 18px 12px 12px 12px;
+        font-weight: bold;
+        color: $text_primary;
+    }
+    $dialog QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 14px;
+        padding: 0 8px;
+    }
+    $dialog QCheckBox {
+        color: $text_primary;
+        spacing: 8px;
+        font-size: 13px;
+    }
+    $dialog QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border-radius: 4px;
+        border: 2px solid $border;
+        background: $bg_secondary;
+    }
+    $dialog QCheckBox::indicator:checked {
+        background-color: $accent;
+        border-color: $accent;
+    }
+    $dialog QTabWidget::pane {
+        border: 1px solid $border;
+        border-radius: 10px;
+        background-color: $bg_primary;
+    }
+    $dialog QTabBar::tab {
+        background-color: $bg_secondary;
+        border: none;
+        padding: 10px 20px;
+        margin-right: 2px;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+        color: $text_secondary;
+    }
+    $dialog QTabBar::tab:selected {
+        background-color: $bg_primary;
+        color: $accent;
+        font-weight: bold;
+    }
+    $dialog QTabBar::tab:hover:!selected {
+        background-color: $bg_tertiary;
+    }
+""")
+
+
+def _format_qss(dark_mode):
+    theme = DARK_THEME if dark_mode else LIGHT_THEME
+    dialog = 'QDialog[theme="dark"]' if dark_mode else 'QDialog[theme="light"]'
+    return _QSS_TEMPLATE.substitute(theme, dialog=dialog)
+
+
+# The themes are constants, so both renderings are produced once at import
+_QSS_CACHE = {False: _format_qss(False), True: _format_qss(True)}
+
+
+def install_global_stylesheet(app):
+    """Install the rules for both dialog themes once on the application.
+
+    Dialogs pick a theme through their "theme" property, so switching
+    themes only re-polishes widgets instead of re-parsing a stylesheet.
+    """
+    qss = _QSS_CACHE[False] + _QSS_CACHE[True]
+    if app.styleSheet() != qss:
+        app.setStyleSheet(qss)
+
+
+# Untranslated combo labels, marked with N_ for extraction; tr() runs when a dialog is built
+_BOOKMARK_FOLDER_LABELS = (N_("Bookmarks Bar"), N_("Other Bookmarks"))
+_BOOKMARK_FOLDER_IDS = ("bookmarks_bar", "other_bookmarks")
+_STARTUP_BEHAVIORS = (N_("Open homepage"), N_("Continue last session"), N_("Open blank tab"))
+# Fallbacks for settings the caller did not pass in
+_DEFAULTS = {
+    'homepage': 'https://www.google.com', 'search_engine': 'Google', 'language': 'tr',
+    'dark_mode': False, 'show_bookmarks_bar': True, 'show_status_bar': True,
+    'do_not_track': True, 'save_passwords': True, 'clear_on_exit': False,
+    'ad_blocker': True, 'javascript_enabled': True, 'https_only': False,
+    'download_path': '', 'ask_download': False,
+}
+# Getter in SettingsDialog._FIELDS -> setter used to load the stored value
+_SETTERS = {'isChecked': 'setChecked', 'text': 'setText'}
+_ENGINE_INDEX = {name: i for i, name in enumerate(SEARCH_ENGINES)}
+_TIME_RANGES = (N_("Last hour"), N_("Last 24 hours"), N_("Last 7 days"),
+                N_("Last 4 weeks"), N_("All time"))
+
+
+@lru_cache(maxsize=16)
+def _translated(labels, language):
+    """tr() over a label tuple; the language argument keys the cache so a switch re-translates."""
+    return tuple(tr(label) for label in labels)
+
+
+@lru_cache(maxsize=None)
+def _font(family, size, weight=QFont.Normal):
+    # Built on first use: QFont needs a running QGuiApplication
+    return QFont(family, size, weight)
+
+
+@lru_cache(maxsize=None)
+def _combo_model(kind):
+    """Item model shared by every settings combo of this kind, built once."""
+    model = QStandardItemModel()
+    if kind == 'language':
+        entries = get_available_languages().items()
+    else:
+        entries = ((name, name) for name in SEARCH_ENGINES)
+    for data, text in entries:
+        item = QStandardItem(text)
+        item.setData(data, Qt.UserRole)
+        model.appendRow(item)
+    return model
+
+
+def _make_vbox(parent, margin, spacing=None):
+    layout = QVBoxLayout(parent)
+    layout.setContentsMargins(margin, margin, margin, margin)
+    if spacing is not None:
+        layout.setSpacing(spacing)
+    return layout
+
+
+def _make_check_group(owner, title, specs):
+    """QGroupBox of checkboxes from (attribute, label, default) specs, each stored on owner."""
+    group = QGroupBox(tr(title))
+    layout = QVBoxLayout(group)
+    for attr, label, default in specs:
+        check = QCheckBox(tr(label))
+        check.setChecked(default)
+        layout.addWidget(check)
+        setattr(owner, attr, check)
+    return group
 
 
 class BaseDialog(QDialog):
     def __init__(self, parent=None, title="", dark_mode=False):
         super().__init__(parent)
         self.dark_mode = dark_mode
+        self.setProperty("theme", "dark" if dark_mode else "light")
         self.setWindowTitle(title)
         self.setModal(True)
-        self._apply_base_style()
 
-    def _apply_base_style(self):
-        theme = DARK_THEME if self.dark_mode else LIGHT_THEME
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {theme['bg_primary']};
-                color: {theme['text_primary']};
-                font-family: 'Segoe UI', system-ui, sans-serif;
-            }}
-            QLabel {{
-                color: {theme['text_primary']};
-            }}
-            QLineEdit, QTextEdit, QComboBox, QSpinBox {{
-                background-color: {theme['bg_secondary']};
-                border: 1px solid {theme['border']};
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: {theme['text_primary']};
-                font-size: 13px;
-            }}
-            QLineEdit:focus, QTextEdit:focus {{
-                border-color: {theme['accent']};
-            }}
-            QPushButton {{
-                background-color: {theme['bg_tertiary']};
-                border: 1px solid {theme['border']};
-                border-radius: 8px;
-                padding: 8px 20px;
-                color: {theme['text_primary']};
-                min-width: 80px;
-                font-size: 13px;
-            }}
-            QPushButton:hover {{
-                background-color: {theme['accent']};
-                color: white;
-                border-color: {theme['accent']};
-            }}
-            QPushButton:pressed {{
-                background-color: {theme['accent_hover']};
-            }}
-            QPushButton#primaryBtn {{
-                background-color: {theme['accent']};
-                color: white;
-                border-color: {theme['accent']};
-            }}
-            QPushButton#primaryBtn:hover {{
-                background-color: {theme['accent_hover']};
-            }}
-            QPushButton#dangerBtn {{
-                background-color: {theme['error']};
-                color: white;
-                border-color: {theme['error']};
-            }}
-            QGroupBox {{
-                border: 1px solid {theme['border']};
-                border-radius: 10px;
-                margin-top: 18px;
-                padding: 18px 12px 12px 12px;
-                font-weight: bold;
-                color: {theme['text_primary']};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 14px;
-                padding: 0 8px;
-            }}
-            QCheckBox {{
-                color: {theme['text_primary']};
-                spacing: 8px;
-                font-size: 13px;
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                border: 2px solid {theme['border']};
-                background: {theme['bg_secondary']};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {theme['accent']};
-                border-color: {theme['accent']};
-            }}
-            QTabWidget::pane {{
-                border: 1px solid {theme['border']};
-                border-radius: 10px;
-                background-color: {theme['bg_primary']};
-            }}
-            QTabBar::tab {{
-                background-color: {theme['bg_secondary']};
-                border: none;
-                padding: 10px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                color: {theme['text_secondary']};
-            }}
-            QTabBar::tab:selected {{
-                background-color: {theme['bg_primary']};
-                color: {theme['accent']};
-                font-weight: bold;
-            }}
-            QTabBar::tab:hover:!selected {{
-                background-color: {theme['bg_tertiary']};
-            }}
-        """)
+    def set_dark_mode(self, dark_mode):
+        if bool(dark_mode) == bool(self.dark_mode):
+            return
+        self.dark_mode = dark_mode
+        self.setProperty("theme", "dark" if dark_mode else "light")
+        style = self.style()
+        for widget in (self, *self.findChildren(QWidget)):
+            style.unpolish(widget)
+            style.polish(widget)
 
 
 class BookmarkDialog(BaseDialog):
@@ -130,31 +229,23 @@ class BookmarkDialog(BaseDialog):
     def __init__(self, parent=None, title="", url="", folder="bookmarks_bar", dark_mode=False):
         super().__init__(parent, tr("Add Bookmark"), dark_mode)
         self.setFixedSize(420, 220)
-        self._setup_ui(title, url)
+        self._setup_ui(title, url, folder)
 
-    def _setup_ui(self, title, url):
-        layout = QVBoxLayout(self)
-        layout.setSpacing(16)
-        layout.setContentsMargins(20, 20, 20, 20)
+    def _setup_ui(self, title, url, folder):
+        layout = _make_vbox(self, 20, 16)
 
-        title_layout = QHBoxLayout()
-        title_layout.addWidget(QLabel(f"{tr('Title')}:"))
+        form = QFormLayout()
         self.title_input = QLineEdit(title)
-        title_layout.addWidget(self.title_input)
-        layout.addLayout(title_layout)
-
-        url_layout = QHBoxLayout()
-        url_layout.addWidget(QLabel(f"{tr('URL')}:"))
+        form.addRow(f"{tr('Title')}:", self.title_input)
         self.url_input = QLineEdit(url)
-        url_layout.addWidget(self.url_input)
-        layout.addLayout(url_layout)
-
-        folder_layout = QHBoxLayout()
-        folder_layout.addWidget(QLabel(f"{tr('Folder')}:"))
+        form.addRow(f"{tr('URL')}:", self.url_input)
         self.folder_combo = QComboBox()
-        self.folder_combo.addItems([tr("Bookmarks Bar"), tr("Other Bookmarks")])
-        folder_layout.addWidget(self.folder_combo)
-        layout.addLayout(folder_layout)
+        labels = _translated(_BOOKMARK_FOLDER_LABELS, get_current_language())
+        for label, folder_id in zip(labels, _BOOKMARK_FOLDER_IDS):
+            self.folder_combo.addItem(label, folder_id)
+        self.folder_combo.setCurrentIndex(max(0, self.folder_combo.findData(folder)))
+        form.addRow(f"{tr('Folder')}:", self.folder_combo)
+        layout.addLayout(form)
 
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
@@ -169,8 +260,7 @@ class BookmarkDialog(BaseDialog):
         layout.addLayout(btn_layout)
 
     def _on_save(self):
-        folder_map = {tr("Bookmarks Bar"): "bookmarks_bar", tr("Other Bookmarks"): "other_bookmarks"}
-        folder = folder_map.get(self.folder_combo.currentText(), "bookmarks_bar")
+        folder = self.folder_combo.currentData() or "bookmarks_bar"
         self.saved.emit(self.title_input.text(), self.url_input.text(), folder)
         self.accept()
 
@@ -184,36 +274,40 @@ class FindDialog(BaseDialog):
     def __init__(self, parent=None, dark_mode=False):
         super().__init__(parent, tr("Find in Page"), dark_mode)
         self.setFixedSize(440, 120)
+        self._pending_text = ""
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(150)
+        self._debounce.timeout.connect(self._emit_find)
         self._setup_ui()
 
     def _setup_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(16, 16, 16, 16)
+        layout = _make_vbox(self, 16)
 
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText(tr("Search..."))
         self.search_input.textChanged.connect(self._on_text_changed)
-        self.search_input.returnPressed.connect(self.find_next.emit)
+        self.search_input.returnPressed.connect(self._on_return_pressed)
         search_layout.addWidget(self.search_input)
 
-        prev_btn = QToolButton()
-        prev_btn.setIcon(load_themed_icon("chevrons-left.svg", self.dark_mode))
-        prev_btn.setIconSize(QSize(16, 16))
-        prev_btn.setFixedSize(32, 32)
-        prev_btn.clicked.connect(self.find_prev.emit)
-        search_layout.addWidget(prev_btn)
-
-        next_btn = QToolButton()
-        next_btn.setIcon(load_themed_icon("chevrons-right.svg", self.dark_mode))
-        next_btn.setIconSize(QSize(16, 16))
-        next_btn.setFixedSize(32, 32)
-        next_btn.clicked.connect(self.find_next.emit)
-        search_layout.addWidget(next_btn)
+        self.prev_btn = QToolButton()
+        self.prev_btn.setIconSize(QSize(16, 16))
+        self.prev_btn.setFixedSize(32, 32)
+        self.prev_btn.clicked.connect(self.find_prev.emit)
+        search_layout.addWidget(self.prev_btn)
+
+        self.next_btn = QToolButton()
+        self.next_btn.setIconSize(QSize(16, 16))
+        self.next_btn.setFixedSize(32, 32)
+        self.next_btn.clicked.connect(self.find_next.emit)
+        search_layout.addWidget(self.next_btn)
+        self._update_icons()
         layout.addLayout(search_layout)
 
         options_layout = QHBoxLayout()
         self.case_check = QCheckBox(tr("Case sensitive"))
+        self.case_check.toggled.connect(self._on_case_toggled)
         options_layout.addWidget(self.case_check)
         options_layout.addStretch()
         close_btn = QPushButton(tr("Close"))
@@ -221,10 +315,37 @@ class FindDialog(BaseDialog):
         options_layout.addWidget(close_btn)
         layout.addLayout(options_layout)
 
+    def _update_icons(self):
+        dark_mode = bool(self.dark_mode)
+        self.prev_btn.setIcon(load_themed_icon("chevrons-left.svg", dark_mode))
+        self.next_btn.setIcon(load_themed_icon("chevrons-right.svg", dark_mode))
+
+    def set_dark_mode(self, dark_mode):
+        super().set_dark_mode(dark_mode)
+        self._update_icons()
+
     def _on_text_changed(self, text):
-        self.find_requested.emit(text, self.case_check.isChecked(), True)
+        self._pending_text = text
+        self._debounce.start()
+
+    @pyqtSlot()
+    def _on_return_pressed(self):
+        if self._debounce.isActive():
+            # The pending search is the first match; a find_next on top would skip it
+            self._debounce.stop()
+            self._emit_find()
+        else:
+            self.find_next.emit()
+
+    @pyqtSlot(bool)
+    def _on_case_toggled(self, _checked):
+        self._on_text_changed(self.search_input.text())
+
+    def _emit_find(self):
+        self.find_requested.emit(self._pending_text, self.case_check.isChecked(), True)
 
     def closeEvent(self, event):
+        self._debounce.stop()
         self.closed.emit()
         super().closeEvent(event)
 
@@ -234,24 +355,51 @@ class FindDialog(BaseDialog):
 
 
 class SettingsDialog(BaseDialog):
+    # Carries only the settings whose value differs from what the dialog was given
     settings_changed = pyqtSignal(dict)
 
+    # (settings key, widget attribute, getter) for everything _on_save reports
+    _FIELDS = (
+        ('homepage', 'homepage_input', 'text'),
+        ('search_engine', 'search_combo', 'currentText'),
+        ('language', 'language_combo', 'currentData'),
+        ('dark_mode', 'dark_mode_check', 'isChecked'),
+        ('show_bookmarks_bar', 'bookmarks_bar_check', 'isChecked'),
+        ('show_status_bar', 'status_bar_check', 'isChecked'),
+        ('do_not_track', 'dnt_check', 'isChecked'),
+        ('save_passwords', 'save_passwords_check', 'isChecked'),
+        ('clear_on_exit', 'clear_on_exit_check', 'isChecked'),
+        ('ad_blocker', 'ad_blocker_check', 'isChecked'),
+        ('javascript_enabled', 'js_enabled_check', 'isChecked'),
+        ('https_only', 'https_only_check', 'isChecked'),
+        ('download_path', 'download_path_input', 'text'),
+        ('ask_download', 'ask_download_check', 'isChecked'),
+    )
+
     def __init__(self, parent=None, settings=None, dark_mode=False):
         super().__init__(parent, tr("Settings"), dark_mode)
         self.settings = settings or {}
+        self._clear_dialog = None
+        self._populated = set()
         self.setFixedSize(620, 520)
         self._setup_ui()
 
     def _setup_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(16, 16, 16, 16)
+        layout = _make_vbox(self, 16)
         tabs = QTabWidget()
 
+        # Only the General tab is built up front; the rest are filled in
+        # the first time they are shown
         tabs.addTab(self._create_general_tab(), tr("General"))
-        tabs.addTab(self._create_appearance_tab(), tr("Appearance"))
-        tabs.addTab(self._create_privacy_tab(), tr("Privacy"))
-        tabs.addTab(self._create_security_tab(), tr("Security"))
-        tabs.addTab(self._create_downloads_tab(), tr("Downloads"))
+        self._populate_fields()
+        self._tab_builders = {}
+        for builder, label in ((self._create_appearance_tab, tr("Appearance")),
+                               (self._create_privacy_tab, tr("Privacy")),
+                               (self._create_security_tab, tr("Security")),
+                               (self._create_downloads_tab, tr("Downloads"))):
+            self._tab_builders[tabs.addTab(QWidget(), label)] = builder
+        tabs.currentChanged.connect(self._ensure_tab_built)
+        self.tabs = tabs
         layout.addWidget(tabs)
 
         btn_layout = QHBoxLayout()
@@ -270,190 +418,172 @@ class SettingsDialog(BaseDialog):
         layout = QFormLayout(widget)
         layout.setSpacing(16)
         layout.setContentsMargins(16, 16, 16, 16)
-        self.homepage_input = QLineEdit(self.settings.get('homepage', 'https://www.google.com'))
+        self.homepage_input = QLineEdit()
         layout.addRow(f"{tr('Homepage')}:", self.homepage_input)
         self.search_combo = QComboBox()
-        self.search_combo.addItems(list(SEARCH_ENGINES.keys()))
-        self.search_combo.setCurrentText(self.settings.get('search_engine', 'Google'))
+        self.search_combo.setModel(_combo_model('search_engine'))
+        self.search_combo.setCurrentIndex(
+            _ENGINE_INDEX.get(self.settings.get('search_engine', _DEFAULTS['search_engine']), 0))
         layout.addRow(f"{tr('Search Engine')}:", self.search_combo)
         self.language_combo = QComboBox()
-        current_lang = self.settings.get('language', 'tr')
-        for code, name in get_available_languages().items():
-            self.language_combo.addItem(name, code)
+        current_lang = self.settings.get('language', _DEFAULTS['language'])
+        self.language_combo.setModel(_combo_model('language'))
         idx = self.language_combo.findData(current_lang)
         if idx >= 0:
             self.language_combo.setCurrentIndex(idx)
         layout.addRow(f"{tr('Language')}:", self.language_combo)
         self.startup_combo = QComboBox()
-        self.startup_combo.addItems([tr("Open homepage"), tr("Continue last session"), tr("Open blank tab")])
+        self.startup_combo.addItems(_translated(_STARTUP_BEHAVIORS, get_current_language()))
         layout.addRow(f"{tr('Startup')}:", self.startup_combo)
         return widget
 
     def _create_appearance_tab(self):
         widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(16, 16, 16, 16)
-        theme_group = QGroupBox(tr("Theme"))
-        theme_layout = QVBoxLayout(theme_group)
-        self.dark_mode_check = QCheckBox(tr("Dark Mode"))
-        self.dark_mode_check.setChecked(self.settings.get('dark_mode', False))
-        theme_layout.addWidget(self.dark_mode_check)
-        layout.addWidget(theme_group)
-        ui_group = QGroupBox(tr("Interface"))
-        ui_layout = QVBoxLayout(ui_group)
-        self.bookmarks_bar_check = QCheckBox(tr("Show bookmarks bar"))
-        self.bookmarks_bar_check.setChecked(self.settings.get('show_bookmarks_bar', True))
-        ui_layout.addWidget(self.bookmarks_bar_check)
-        self.status_bar_check = QCheckBox(tr("Show status bar"))
-        self.status_bar_check.setChecked(self.settings.get('show_status_bar', True))
-        ui_layout.addWidget(self.status_bar_check)
-        layout.addWidget(ui_group)
+        layout = _make_vbox(widget, 16)
+        layout.addWidget(_make_check_group(self, N_("Theme"), (
+            ('dark_mode_check', N_("Dark Mode"), False),
+        )))
+        layout.addWidget(_make_check_group(self, N_("Interface"), (
+            ('bookmarks_bar_check', N_("Show bookmarks bar"), False),
+            ('status_bar_check', N_("Show status bar"), False),
+        )))
         layout.addStretch()
         return widget
 
     def _create_privacy_tab(self):
         widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(16, 16, 16, 16)
-        tracking_group = QGroupBox(tr("Tracking"))
-        tracking_layout = QVBoxLayout(tracking_group)
-        self.dnt_check = QCheckBox(tr("Send 'Do Not Track' request"))
-        self.dnt_check.setChecked(self.settings.get('do_not_track', True))
-        tracking_layout.addWidget(self.dnt_check)
-        self.third_party_cookies_check = QCheckBox(tr("Block third-party cookies"))
-        tracking_layout.addWidget(self.third_party_cookies_check)
-        layout.addWidget(tracking_group)
-        data_group = QGroupBox(tr("Data"))
-        data_layout = QVBoxLayout(data_group)
-        self.save_passwords_check = QCheckBox(tr("Save passwords"))
-        self.save_passwords_check.setChecked(self.settings.get('save_passwords', True))
-        data_layout.addWidget(self.save_passwords_check)
-        self.autofill_check = QCheckBox(tr("Auto-fill forms"))
-        self.autofill_check.setChecked(True)
-        data_layout.addWidget(self.autofill_check)
-        self.clear_on_exit_check = QCheckBox(tr("Clear data on exit"))
-        data_layout.addWidget(self.clear_on_exit_check)
+        layout = _make_vbox(widget, 16)
+        layout.addWidget(_make_check_group(self, N_("Tracking"), (
+            ('dnt_check', N_("Send 'Do Not Track' request"), False),
+            ('third_party_cookies_check', N_("Block third-party cookies"), False),
+        )))
+        data_group = _make_check_group(self, N_("Data"), (
+            ('save_passwords_check', N_("Save passwords"), False),
+            ('autofill_check', N_("Auto-fill forms"), True),
+            ('clear_on_exit_check', N_("Clear data on exit"), False),
+        ))
         clear_btn = QPushButton(tr("Clear Browsing Data..."))
         clear_btn.clicked.connect(self._show_clear_data_dialog)
-        data_layout.addWidget(clear_btn)
+        data_group.layout().addWidget(clear_btn)
         layout.addWidget(data_group)
         layout.addStretch()
         return widget
 
     def _create_security_tab(self):
         widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(16, 16, 16, 16)
-        security_group = QGroupBox(tr("Security"))
-        security_layout = QVBoxLayout(security_group)
-        self.ad_blocker_check = QCheckBox(tr("Ad blocker"))
-        self.ad_blocker_check.setChecked(self.settings.get('ad_blocker', True))
-        security_layout.addWidget(self.ad_blocker_check)
-        self.phishing_check = QCheckBox(tr("Phishing protection"))
-        self.phishing_check.setChecked(True)
-        security_layout.addWidget(self.phishing_check)
-        self.https_only_check = QCheckBox(tr("Use HTTPS only"))
-        security_layout.addWidget(self.https_only_check)
-        layout.addWidget(security_group)
-        js_group = QGroupBox(tr("JavaScript"))
-        js_layout = QVBoxLayout(js_group)
-        self.js_enabled_check = QCheckBox(tr("Enable JavaScript"))
-        self.js_enabled_check.setChecked(self.settings.get('javascript_enabled', True))
-        js_layout.addWidget(self.js_enabled_check)
-        layout.addWidget(js_group)
+        layout = _make_vbox(widget, 16)
+        layout.addWidget(_make_check_group(self, N_("Security"), (
+            ('ad_blocker_check', N_("Ad blocker"), False),
+            ('phishing_check', N_("Phishing protection"), True),
+            ('https_only_check', N_("Use HTTPS only"), False),
+        )))
+        layout.addWidget(_make_check_group(self, N_("JavaScript"), (
+            ('js_enabled_check', N_("Enable JavaScript"), False),
+        )))
         layout.addStretch()
         return widget
 
     def _create_downloads_tab(self):
         widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(16, 16, 16, 16)
+        layout = _make_vbox(widget, 16)
         location_group = QGroupBox(tr("Location"))
         location_layout = QHBoxLayout(location_group)
-        self.download_path_input = QLineEdit(self.settings.get('download_path', ''))
+        self.download_path_input = QLineEdit()
         location_layout.addWidget(self.download_path_input)
         browse_btn = QPushButton(tr("Browse..."))
         browse_btn.clicked.connect(self._browse_download_path)
         location_layout.addWidget(browse_btn)
         layout.addWidget(location_group)
-        options_group = QGroupBox(tr("Options"))
-        options_layout = QVBoxLayout(options_group)
-        self.ask_download_check = QCheckBox(tr("Ask for location on each download"))
-        options_layout.addWidget(self.ask_download_check)
-        self.auto_open_check = QCheckBox(tr("Auto-open completed downloads"))
-        options_layout.addWidget(self.auto_open_check)
-        layout.addWidget(options_group)
+        layout.addWidget(_make_check_group(self, N_("Options"), (
+            ('ask_download_check', N_("Ask for location on each download"), False),
+            ('auto_open_check', N_("Auto-open completed downloads"), False),
+        )))
         layout.addStretch()
         return widget
 
+    def _ensure_tab_built(self, index):
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        page_layout = _make_vbox(self.tabs.widget(index), 0)
+        page_layout.addWidget(builder())
+        self._populate_fields()
+
+    def _populate_fields(self):
+        """Load stored values into widgets built since the last call."""
+        settings = self.settings
+        for key, attr, getter in self._FIELDS:
+            setter = _SETTERS.get(getter)
+            if setter is None or attr in self._populated:
+                continue
+            widget = getattr(self, attr, None)
+            if widget is not None:
+                getattr(widget, setter)(settings.get(key, _DEFAULTS[key]))
+                self._populated.add(attr)
+
+    def _value(self, key, attr, getter):
+        """Read a setting from its widget, or keep the incoming value if its tab was never opened."""
+        widget = getattr(self, attr, None)
+        if widget is None:
+            return self.settings.get(key, _DEFAULTS[key])
+        return getattr(widget, getter)()
+
     def _browse_download_path(self):
         path = QFileDialog.getExistingDirectory(self, tr("Select Download Folder"))
         if path:
             self.download_path_input.setText(path)
 
     def _show_clear_data_dialog(self):
-        dialog = ClearDataDialog(self, self.dark_mode)
-        dialog.exec_()
+        if self._clear_dialog is None:
+            self._clear_dialog = ClearDataDialog(self, self.dark_mode)
+        else:
+            self._clear_dialog.reset()
+        # Window-modal show() blocks this dialog without a nested event loop;
+        # the instance is reused, so it is not deleted on finish
+        self._clear_dialog.show()
 
     def _on_save(self):
-        settings = {
-            'homepage': self.homepage_input.text(),
-            'search_engine': self.search_combo.currentText(),
-            'language': self.language_combo.currentData(),
-            'dark_mode': self.dark_mode_check.isChecked(),
-            'show_bookmarks_bar': self.bookmarks_bar_check.isChecked(),
-            'show_status_bar': self.status_bar_check.isChecked(),
-            'do_not_track': self.dnt_check.isChecked(),
-            'save_passwords': self.save_passwords_check.isChecked(),
-            'clear_on_exit': self.clear_on_exit_check.isChecked(),
-            'ad_blocker': self.ad_blocker_check.isChecked(),
-            'javascript_enabled': self.js_enabled_check.isChecked(),
-            'https_only': self.https_only_check.isChecked(),
-            'download_path': self.download_path_input.text(),
-            'ask_download': self.ask_download_check.isChecked(),
-        }
-        self.settings_changed.emit(settings)
+        value = self._value
+        current = self.settings
+        changed = {}
+        for key, attr, getter in self._FIELDS:
+            new = value(key, attr, getter)
+            if new != current.get(key, _DEFAULTS[key]):
+                changed[key] = new
+        if changed:
+            self.settings_changed.emit(changed)
         self.accept()
 
 
 class ClearDataDialog(BaseDialog):
     clear_requested = pyqtSignal(dict)
 
+    # (widget attribute, label, checked by default)
+    _CHECKS = (
+        ('history_check', N_("Browsing history"), True),
+        ('cookies_check', N_("Cookies and site data"), True),
+        ('cache_check', N_("Cache"), True),
+        ('downloads_check', N_("Download history"), False),
+        ('passwords_check', N_("Saved passwords"), False),
+        ('autofill_check', N_("Autofill data"), False),
+    )
+
     def __init__(self, parent=None, dark_mode=False):
         super().__init__(parent, tr("Clear Browsing Data"), dark_mode)
+        self.setWindowModality(Qt.WindowModal)
         self.setFixedSize(420, 380)
         self._setup_ui()
 
     def _setup_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(20, 20, 20, 20)
-        layout.setSpacing(16)
+        layout = _make_vbox(self, 20, 16)
 
-        time_layout = QHBoxLayout()
-        time_layout.addWidget(QLabel(f"{tr('Time range')}:"))
+        form = QFormLayout()
         self.time_combo = QComboBox()
-        self.time_combo.addItems([tr("Last hour"), tr("Last 24 hours"), tr("Last 7 days"), tr("Last 4 weeks"), tr("All time")])
-        time_layout.addWidget(self.time_combo)
-        layout.addLayout(time_layout)
-
-        data_group = QGroupBox(tr("Data to clear"))
-        data_layout = QVBoxLayout(data_group)
-        self.history_check = QCheckBox(tr("Browsing history"))
-        self.history_check.setChecked(True)
-        data_layout.addWidget(self.history_check)
-        self.cookies_check = QCheckBox(tr("Cookies and site data"))
-        self.cookies_check.setChecked(True)
-        data_layout.addWidget(self.cookies_check)
-        self.cache_check = QCheckBox(tr("Cache"))
-        self.cache_check.setChecked(True)
-        data_layout.addWidget(self.cache_check)
-        self.downloads_check = QCheckBox(tr("Download history"))
-        data_layout.addWidget(self.downloads_check)
-        self.passwords_check = QCheckBox(tr("Saved passwords"))
-        data_layout.addWidget(self.passwords_check)
-        self.autofill_check = QCheckBox(tr("Autofill data"))
-        data_layout.addWidget(self.autofill_check)
-        layout.addWidget(data_group)
+        self.time_combo.addItems(_translated(_TIME_RANGES, get_current_language()))
+        form.addRow(f"{tr('Time range')}:", self.time_combo)
+        layout.addLayout(form)
+
+        layout.addWidget(_make_check_group(self, N_("Data to clear"), self._CHECKS))
 
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
@@ -466,6 +596,12 @@ class ClearDataDialog(BaseDialog):
         btn_layout.addWidget(clear_btn)
         layout.addLayout(btn_layout)
 
+    def reset(self):
+        """Restore the default selection so a reused dialog opens like a fresh one."""
+        self.time_combo.setCurrentIndex(0)
+        for attr, _label, checked in self._CHECKS:
+            getattr(self, attr).setChecked(checked)
+
     def _on_clear(self):
         data = {
             'time_range': self.time_combo.currentIndex(),
@@ -487,10 +623,8 @@ class AboutDialog(BaseDialog):
         self._setup_ui()
 
     def _setup_ui(self):
-        layout = QVBoxLayout(self)
+        layout = _make_vbox(self, 32, 20)
         layout.setAlignment(Qt.AlignCenter)
-        layout.setSpacing(20)
-        layout.setContentsMargins(32, 32, 32, 32)
 
         icon_label = QLabel()
         icon_label.setPixmap(load_themed_icon("globe.svg", self.dark_mode).pixmap(80, 80))
@@ -499,7 +633,7 @@ class AboutDialog(BaseDialog):
         layout.addWidget(icon_label, 0, Qt.AlignCenter)
 
         name_label = QLabel(APP_NAME)
-        name_label.setFont(QFont("Segoe UI", 22, QFont.Bold))
+        name_label.setFont(_font("Segoe UI", 22, QFont.Bold))
         name_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(name_label)
 
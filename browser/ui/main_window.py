@@ -10,9 +10,9 @@ from PyQt5.QtWidgets import (QMainWindow, QTabWidget, QTabBar, QWidget,
                              QPushButton, QLabel, QProgressBar, QGraphicsOpacityEffect,
                              QFrame)
 from PyQt5.QtWebEngineWidgets import QWebEngineProfile
-from PyQt5.QtCore import (Qt, QUrl, pyqtSignal, QSize, QStandardPaths,
+from PyQt5.QtCore import (Qt, QUrl, pyqtSignal, pyqtSlot, QSize, QStandardPaths,
                            QTimer, QPropertyAnimation, QEasingCurve)
-from PyQt5.QtGui import QKeySequence, QColor, QFont, QPalette
+from PyQt5.QtGui import QKeySequence, QColor, QFont, QPalette, QIcon
 from PyQt5.QtPrintSupport import QPrintDialog, QPrinter
 
 from ..core.browser_tab import BrowserTab
@@ -29,10 +29,10 @@ from .toolbar import BrowserToolbar
 from .sidebar import Sidebar
 from .status_bar import StatusBar
 from .dialogs import (BookmarkDialog, FindDialog, SettingsDialog,
-                      AboutDialog, ClearDataDialog)
+                      AboutDialog, ClearDataDialog, install_global_stylesheet)
 from ..utils.constants import (LIGHT_THEME, DARK_THEME, APP_NAME, APP_VERSION,
-                               SHORTCUTS, DEFAULT_HOME_URL)
-from ..utils.helpers import truncate_text, load_icon, load_themed_icon
+                               SHORTCUTS)
+from ..utils.helpers import truncate_text, load_icon, load_themed_icon, get_icon_path
 from ..utils.i18n import _ as tr
 
 log = logging.getLogger(__name__)
@@ -278,6 +278,100 @@ class ModernTabWidget(QTabWidget):
             self.tabCloseRequested.emit(i)
 
 
+# Main window sheets keyed by (dark_mode, private_mode), formatted on first use
+_STYLE_CACHE = {}
+_CLOSE_ICON_PATH = get_icon_path("x.svg").replace("\\", "/")
+
+
+def _build_stylesheet(theme, private_mode):
+    private_style = ""
+    if private_mode:
+        private_style = f"""
+        #privateBanner {{
+            background-color: {theme['private_tab']};
+            border: none;
+            min-height: 32px;
+        }}
+        #privateBannerText {{
+            color: #ffffff;
+            font-size: 12px;
+        }}
+        """
+
+    return f"""
+        QMainWindow {{
+            background-color: {theme['bg_primary']};
+        }}
+        ModernTabWidget::pane {{
+            border: none;
+            background-color: {theme['bg_primary']};
+        }}
+        ModernTabBar {{
+            background-color: {theme['bg_secondary']};
+            font-family: 'Segoe UI', system-ui, sans-serif;
+            font-size: 13px;
+        }}
+        ModernTabBar::tab {{
+            background-color: {theme['bg_secondary']};
+            color: {theme['text_primary']};
+            padding: 8px 16px;
+            margin-right: 1px;
+            border-top-left-radius: 10px;
+            border-top-right-radius: 10px;
+            min-width: 120px;
+            max-width: 220px;
+        }}
+        ModernTabBar::tab:selected {{
+            background-color: {theme['bg_primary']};
+        }}
+        ModernTabBar::tab:hover:!selected {{
+            background-color: {theme['bg_tertiary']};
+        }}
+        ModernTabBar::close-button {{
+            image: url({_CLOSE_ICON_PATH});
+            subcontrol-origin: padding;
+            subcontrol-position: right;
+            padding: 4px;
+            border-radius: 4px;
+            width: 12px;
+            height: 12px;
+        }}
+        ModernTabBar::close-button:hover {{
+            background-color: {theme['error']};
+        }}
+        #addTabBtn {{
+            background-color: transparent;
+            border: none;
+            border-radius: 8px;
+        }}
+        #addTabBtn:hover {{
+            background-color: {theme['bg_hover']};
+        }}
+        QMenu {{
+            background-color: {theme['bg_primary']};
+            color: {theme['text_primary']};
+            border: 1px solid {theme['border']};
+            border-radius: 8px;
+            padding: 4px;
+            font-family: 'Segoe UI', system-ui, sans-serif;
+        }}
+        QMenu::item {{
+            padding: 8px 24px;
+            border-radius: 6px;
+        }}
+        QMenu::item:selected {{
+            background-color: {theme['accent']};
+            color: white;
+        }}
+        QMenu::separator {{
+            height: 1px;
+            background-color: {theme['border']};
+            margin: 4px 8px;
+        }}
+        {private_style}
+    """
+
+
 class MainWindow(QMainWindow):
     def __init__(self, private_mode=False):
         super().__init__()
@@ -294,6 +388,15 @@ class MainWindow(QMainWindow):
         self._closed_tabs = []
         self._find_dialog = None
         self._private_profile = None
+        # URL lookup for the toolbar star; refreshed on bookmarks_changed
+        self._bookmarked_urls = {b.url for b in self.bookmark_manager.get_all_bookmarks()}
+        # loadProgress can fire many times a second; forward it at most every 50 ms
+        self._pending_progress = -1
+        self._shown_progress = -1
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._flush_progress)
 
         if self._private_mode:
             self._private_profile = self.engine.create_private_profile(self)
@@ -301,9 +404,10 @@ class MainWindow(QMainWindow):
         self._setup_window()
         self._setup_ad_blocker()
         self._setup_ui()
-        self._setup_menu()
+        self.main_menu = None  # built on first _show_menu()
         self._setup_shortcuts()
         self._connect_signals()
+        install_global_stylesheet(QApplication.instance())
         self._apply_style()
 
         if self._private_mode:
@@ -339,8 +443,8 @@ class MainWindow(QMainWindow):
 
         self.sidebar = Sidebar(dark_mode=self._dark_mode)
         self.sidebar.hide()
-        self.sidebar.bookmark_clicked.connect(lambda url: self.add_new_tab(QUrl(url)))
-        self.sidebar.history_clicked.connect(lambda url: self.add_new_tab(QUrl(url)))
+        self.sidebar.bookmark_clicked.connect(self._open_url_in_new_tab)
+        self.sidebar.history_clicked.connect(self._open_url_in_new_tab)
         self.sidebar.download_open_clicked.connect(self.download_manager.open_file)
         self.sidebar.download_cancel_clicked.connect(self.download_manager.cancel_download)
         self.sidebar.clear_history_btn.clicked.connect(self._clear_history)
@@ -375,7 +479,7 @@ class MainWindow(QMainWindow):
         self.tabs.setDocumentMode(True)
         self.tabs.tabCloseRequested.connect(self.close_tab)
         self.tabs.currentChanged.connect(self._on_tab_changed)
-        self.tabs.new_tab_requested.connect(lambda: self.add_new_tab())
+        self.tabs.new_tab_requested.connect(self._open_new_tab)
         content_layout.addWidget(self.tabs)
 
         main_layout.addWidget(content_widget)
@@ -388,12 +492,12 @@ class MainWindow(QMainWindow):
         self.download_toast = DownloadToast(self, dark_mode=self._dark_mode)
         self.download_toast.open_downloads.connect(self._show_downloads)
 
-    def _setup_menu(self):
+    def _build_main_menu(self):
         self.main_menu = QMenu(self)
 
         new_tab = self.main_menu.addAction(tr("New Tab"))
         new_tab.setShortcut(SHORTCUTS['new_tab'])
-        new_tab.triggered.connect(lambda: self.add_new_tab())
+        new_tab.triggered.connect(self._open_new_tab)
 
         new_window = self.main_menu.addAction(tr("New Window"))
         new_window.setShortcut(SHORTCUTS['new_window'])
@@ -473,6 +577,11 @@ class MainWindow(QMainWindow):
         quit_action.setShortcut(SHORTCUTS['quit'])
         quit_action.triggered.connect(self.close)
 
+        # The window-level QShortcuts handle the keys; menu actions only display them
+        for action in self.main_menu.findChildren(QAction):
+            action.setShortcutContext(Qt.WidgetShortcut)
+        return self.main_menu
+
     def _setup_shortcuts(self):
         QShortcut(QKeySequence(SHORTCUTS['next_tab']), self, self._next_tab)
         QShortcut(QKeySequence(SHORTCUTS['prev_tab']), self, self._prev_tab)
@@ -482,15 +591,28 @@ class MainWindow(QMainWindow):
         QShortcut(QKeySequence(SHORTCUTS['hard_refresh']), self, self._hard_reload)
         QShortcut(QKeySequence(SHORTCUTS['bookmark']), self, self._toggle_bookmark)
         QShortcut(QKeySequence("Escape"), self, self._stop_loading)
+        # Same keys as the main menu actions, active before the menu is first built
+        for name, slot in (
+            ('new_tab', self._open_new_tab), ('new_window', self._open_new_window),
+            ('private_tab', self._open_private_window), ('reopen_tab', self._reopen_closed_tab),
+            ('history_panel', self._show_history), ('bookmarks_panel', self._show_bookmarks),
+            ('downloads_panel', self._show_downloads), ('zoom_in', self._zoom_in),
+            ('zoom_out', self._zoom_out), ('zoom_reset', self._reset_zoom),
+            ('fullscreen', self._toggle_fullscreen), ('find', self._show_find_dialog),
+            ('reader_mode', self._toggle_reader_mode), ('screenshot', self._take_screenshot),
+            ('view_source', self._view_source), ('dev_tools', self._open_dev_tools),
+            ('print', self._print_page), ('settings', self._show_settings), ('quit', self.close),
+        ):
+            QShortcut(QKeySequence(SHORTCUTS[name]), self, slot)
 
     def _connect_signals(self):
-        self.toolbar.back_clicked.connect(lambda: self._current_tab().back() if self._current_tab() else None)
-        self.toolbar.forward_clicked.connect(lambda: self._current_tab().forward() if self._current_tab() else None)
+        self.toolbar.back_clicked.connect(self._go_back)
+        self.toolbar.forward_clicked.connect(self._go_forward)
         self.toolbar.reload_clicked.connect(self._reload_page)
         self.toolbar.stop_clicked.connect(self._stop_loading)
         self.toolbar.home_clicked.connect(self._go_home)
         self.toolbar.navigate_requested.connect(self._navigate_to)
-        self.toolbar.new_tab_clicked.connect(lambda: self.add_new_tab())
+        self.toolbar.new_tab_clicked.connect(self._open_new_tab)
         self.toolbar.new_window_clicked.connect(self._open_new_window)
         self.toolbar.private_tab_clicked.connect(self._open_private_window)
         self.toolbar.bookmark_clicked.connect(self._toggle_bookmark)
@@ -500,122 +622,41 @@ class MainWindow(QMainWindow):
         self.engine.default_profile.downloadRequested.connect(self._handle_download)
         if self._private_profile:
             self._private_profile.downloadRequested.connect(self._handle_download)
-        self.download_manager.download_started.connect(
-            lambda d: self.download_toast.show_download(d)
-        )
-        self.download_manager.download_progress.connect(
-            lambda d: self.download_toast.update_progress(d)
-        )
-        self.download_manager.download_completed.connect(
-            lambda d: (self.download_toast.show_completed(d),
-                       self.status_bar.show_message(f"{tr('Download completed')}: {d.filename}"))
-        )
-        self.download_manager.download_failed.connect(
-            lambda d: self.status_bar.show_message(f"{tr('Download failed')}: {d.filename}")
-        )
+        self.download_manager.download_started.connect(self.download_toast.show_download)
+        self.download_manager.download_progress.connect(self.download_toast.update_progress)
+        self.download_manager.download_completed.connect(self._on_download_completed)
+        self.download_manager.download_failed.connect(self._on_download_failed)
 
         self.bookmark_manager.bookmarks_changed.connect(self._update_sidebar_bookmarks)
         self.history_manager.history_changed.connect(self._update_sidebar_history)
         self.download_manager.downloads_changed.connect(self._update_sidebar_downloads)
 
     def _apply_style(self):
-        theme = DARK_THEME if self._dark_mode else LIGHT_THEME
-        close_icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "resources", "icons", "x.svg").replace("\\", "/")
-
-        private_style = ""
-        if self._private_mode:
-            private_style = f"""
-            #privateBanner {{
-                background-color: {theme['private_tab']};
-                border: none;
-                min-height: 32px;
-            }}
-            #privateBannerText {{
-                color: #ffffff;
-                font-size: 12px;
-            }}
-            """
-
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {theme['bg_primary']};
-            }}
-            QTabWidget::pane {{
-                border: none;
-                background-color: {theme['bg_primary']};
-            }}
-            QTabBar {{
-                background-color: {theme['bg_secondary']};
-                font-family: 'Segoe UI', system-ui, sans-serif;
-                font-size: 13px;
-            }}
-            QTabBar::tab {{
-                background-color: {theme['bg_secondary']};
-                color: {theme['text_primary']};
-                padding: 8px 16px;
-                margin-right: 1px;
-                border-top-left-radius: 10px;
-                border-top-right-radius: 10px;
-                min-width: 120px;
-                max-width: 220px;
-            }}
-            QTabBar::tab:selected {{
-                background-color: {theme['bg_primary']};
-            }}
-            QTabBar::tab:hover:!selected {{
-                background-color: {theme['bg_tertiary']};
-            }}
-            QTabBar::close-button {{
-                image: url({close_icon_path});
-                subcontrol-origin: padding;
-                subcontrol-position: right;
-                padding: 4px;
-                border-radius: 4px;
-                width: 12px;
-                height: 12px;
-            }}
-            QTabBar::close-button:hover {{
-                background-color: {theme['error']};
-            }}
-            #addTabBtn {{
-                background-color: transparent;
-                border: none;
-                border-radius: 8px;
-            }}
-            #addTabBtn:hover {{
-                background-color: {theme['bg_hover']};
-            }}
-            QMenu {{
-                background-color: {theme['bg_primary']};
-                color: {theme['text_primary']};
-                border: 1px solid {theme['border']};
-                border-radius: 8px;
-                padding: 4px;
-                font-family: 'Segoe UI', system-ui, sans-serif;
-            }}
-            QMenu::item {{
-                padding: 8px 24px;
-                border-radius: 6px;
-            }}
-            QMenu::item:selected {{
-                background-color: {theme['accent']};
-                color: white;
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background-color: {theme['border']};
-                margin: 4px 8px;
-            }}
-            {private_style}
-        """)
+        key = (bool(self._dark_mode), bool(self._private_mode))
+        css = _STYLE_CACHE.get(key)
+        if css is None:
+            theme = DARK_THEME if self._dark_mode else LIGHT_THEME
+            css = _STYLE_CACHE[key] = _build_stylesheet(theme, self._private_mode)
+        if self.styleSheet() != css:
+            self.setStyleSheet(css)
 
         self.toolbar.set_dark_mode(self._dark_mode)
         self.sidebar.set_dark_mode(self._dark_mode)
         self.status_bar.set_dark_mode(self._dark_mode)
         self.download_toast.set_dark_mode(self._dark_mode)
         self.tabs.set_dark_mode(self._dark_mode)
+        if self._find_dialog:
+            self._find_dialog.set_dark_mode(self._dark_mode)
 
     # ---- Tab Management ----
+    @pyqtSlot()
+    def _open_new_tab(self):
+        self.add_new_tab()
+
+    @pyqtSlot(str)
+    def _open_url_in_new_tab(self, url):
+        self.add_new_tab(QUrl(url))
+
     def add_new_tab(self, url=None, private=False, switch_to=True):
         # In private window, all tabs are private
         if self._private_mode:
@@ -639,12 +680,13 @@ class MainWindow(QMainWindow):
             private_icon = load_icon("eye-off.svg", color)
             self.tabs.setTabIcon(index, private_icon)
 
-        tab.titleChanged.connect(lambda title, t=tab: self._update_tab_title(t, title))
-        tab.urlChanged.connect(lambda url, t=tab: self._on_url_changed(t, url))
-        tab.loadStarted.connect(lambda t=tab: self._on_load_started(t))
-        tab.loadProgress.connect(lambda p, t=tab: self._on_load_progress(t, p))
-        tab.loadFinished.connect(lambda ok, t=tab: self._on_load_finished(t, ok))
-        tab.iconChanged.connect(lambda icon, t=tab: self._update_tab_icon(t, icon))
+        # Bound slots find the tab via sender(), so no closure keeps it alive
+        tab.titleChanged.connect(self._on_tab_title_changed)
+        tab.urlChanged.connect(self._on_tab_url_changed)
+        tab.loadStarted.connect(self._on_tab_load_started)
+        tab.loadProgress.connect(self._on_tab_load_progress)
+        tab.loadFinished.connect(self._on_tab_load_finished)
+        tab.iconChanged.connect(self._on_tab_icon_changed)
 
         if switch_to:
             self.tabs.setCurrentIndex(index)
@@ -670,19 +712,51 @@ class MainWindow(QMainWindow):
         tab = self.tabs.widget(index)
         if not tab:
             return
-        self.toolbar.set_url(tab.url())
-        self.toolbar.set_navigation_state(tab.history().canGoBack(), tab.history().canGoForward())
-        self.toolbar.set_security(tab.is_secure)
-        self.toolbar.set_bookmarked(self.bookmark_manager.is_bookmarked(tab.url().toString()))
-        self.status_bar.set_zoom(tab.get_zoom())
-        self.status_bar.set_security(tab.is_secure)
+        self._reset_progress()
+        toolbar = self.toolbar
+        status_bar = self.status_bar
+        url = tab.url()
+        history = tab.history()
+        is_secure = tab.is_secure
+        toolbar.set_url(url)
+        toolbar.set_navigation_state(history.canGoBack(), history.canGoForward())
+        toolbar.set_security(is_secure)
+        toolbar.set_bookmarked(url.toString() in self._bookmarked_urls)
+        status_bar.set_zoom(tab.get_zoom())
+        status_bar.set_security(is_secure)
         self._update_window_title(tab.get_title())
 
+    # ---- Per-tab signals; sender() is the emitting BrowserTab ----
+    @pyqtSlot(str)
+    def _on_tab_title_changed(self, title):
+        self._update_tab_title(self.sender(), title)
+
+    @pyqtSlot(QUrl)
+    def _on_tab_url_changed(self, url):
+        self._on_url_changed(self.sender(), url)
+
+    @pyqtSlot()
+    def _on_tab_load_started(self):
+        self._on_load_started(self.sender())
+
+    @pyqtSlot(int)
+    def _on_tab_load_progress(self, progress):
+        self._on_load_progress(self.sender(), progress)
+
+    @pyqtSlot(bool)
+    def _on_tab_load_finished(self, success):
+        self._on_load_finished(self.sender(), success)
+
+    @pyqtSlot(QIcon)
+    def _on_tab_icon_changed(self, icon):
+        self._update_tab_icon(self.sender(), icon)
+
     def _update_tab_title(self, tab, title):
-        index = self.tabs.indexOf(tab)
+        tabs = self.tabs
+        index = tabs.indexOf(tab)
         if index >= 0:
-            self.tabs.setTabText(index, truncate_text(title, 20))
-            self.tabs.setTabToolTip(index, title)
+            tabs.setTabText(index, truncate_text(title, 20))
+            tabs.setTabToolTip(index, title)
             if tab == self._current_tab():
                 self._update_window_title(title)
 
@@ -696,12 +770,12 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(f"{title} - {APP_NAME}{suffix}" if title else f"{APP_NAME}{suffix}")
 
     def _next_tab(self):
-        current = self.tabs.currentIndex()
-        self.tabs.setCurrentIndex((current + 1) % self.tabs.count())
+        tabs = self.tabs
+        tabs.setCurrentIndex((tabs.currentIndex() + 1) % tabs.count())
 
     def _prev_tab(self):
-        current = self.tabs.currentIndex()
-        self.tabs.setCurrentIndex((current - 1) % self.tabs.count())
+        tabs = self.tabs
+        tabs.setCurrentIndex((tabs.currentIndex() - 1) % tabs.count())
 
     def _reopen_closed_tab(self):
         if self._closed_tabs:
@@ -709,38 +783,66 @@ class MainWindow(QMainWindow):
             self.add_new_tab(QUrl(info['url']), private=info['private'])
 
     # ---- Navigation ----
+    @pyqtSlot()
+    def _go_back(self):
+        tab = self._current_tab()
+        if tab:
+            tab.back()
+
+    @pyqtSlot()
+    def _go_forward(self):
+        tab = self._current_tab()
+        if tab:
+            tab.forward()
+
     def _on_url_changed(self, tab, url):
         if tab == self._current_tab():
-            self.toolbar.set_url(url)
-            self.toolbar.set_security(url.scheme() == 'https')
-            self.toolbar.set_bookmarked(self.bookmark_manager.is_bookmarked(url.toString()))
-            self.status_bar.set_security(url.scheme() == 'https')
+            toolbar = self.toolbar
+            is_https = url.scheme() == 'https'
+            toolbar.set_url(url)
+            toolbar.set_security(is_https)
+            toolbar.set_bookmarked(url.toString() in self._bookmarked_urls)
+            self.status_bar.set_security(is_https)
 
     def _on_load_started(self, tab):
         if tab == self._current_tab():
             self.toolbar.set_loading(True)
 
     def _on_load_progress(self, tab, progress):
-        if tab == self._current_tab():
-            self.status_bar.show_progress(progress)
+        if tab == self._current_tab() and progress != self._shown_progress:
+            self._pending_progress = progress
+            if not self._progress_timer.isActive():
+                self._progress_timer.start()
+
+    def _flush_progress(self):
+        self._shown_progress = self._pending_progress
+        self.status_bar.show_progress(self._shown_progress)
+
+    def _reset_progress(self):
+        # Drop a queued value so it cannot re-show the bar for a finished or hidden tab
+        self._progress_timer.stop()
+        self._shown_progress = -1
 
     def _on_load_finished(self, tab, success):
         if tab == self._current_tab():
+            self._reset_progress()
             self.toolbar.set_loading(False)
             self.status_bar.hide_progress()
-            self.toolbar.set_navigation_state(tab.history().canGoBack(), tab.history().canGoForward())
+            history = tab.history()
+            self.toolbar.set_navigation_state(history.canGoBack(), history.canGoForward())
 
         if success and not tab.private:
             self.history_manager.add_entry(tab.url().toString(), tab.get_title())
 
-        if self.ad_blocker and self.ad_blocker.is_enabled():
+        ad_blocker = self.ad_blocker
+        if ad_blocker and ad_blocker.is_enabled():
             ElementHider.inject_element_hiding(tab)
 
         if self._dark_mode:
             tab.inject_dark_mode()
 
-        if self.ad_blocker:
-            self.status_bar.set_blocked_count(self.ad_blocker.get_blocked_count())
+        if ad_blocker:
+            self.status_bar.set_blocked_count(ad_blocker.get_blocked_count())
 
     def _navigate_to(self, text):
         url, is_search = self.search_manager.process_input(text)
@@ -792,7 +894,7 @@ class MainWindow(QMainWindow):
             return
         url = tab.url().toString()
         title = tab.get_title()
-        if self.bookmark_manager.is_bookmarked(url):
+        if url in self._bookmarked_urls:
             bookmark = self.bookmark_manager.get_bookmark_by_url(url)
             if bookmark:
                 self.bookmark_manager.remove_bookmark(bookmark.id)
@@ -822,7 +924,9 @@ class MainWindow(QMainWindow):
         self.sidebar.show_panel("downloads")
 
     def _update_sidebar_bookmarks(self):
-        self.sidebar.update_bookmarks(self.bookmark_manager.get_all_bookmarks())
+        bookmarks = self.bookmark_manager.get_all_bookmarks()
+        self._bookmarked_urls = {b.url for b in bookmarks}
+        self.sidebar.update_bookmarks(bookmarks)
 
     def _update_sidebar_history(self):
         self.sidebar.update_history(self.history_manager.get_recent_entries(50))
@@ -846,8 +950,19 @@ class MainWindow(QMainWindow):
         self.status_bar.show_message(f"{tr('Download started')}: {download.suggestedFileName()}")
         self._update_sidebar_downloads()
 
+    @pyqtSlot(object)
+    def _on_download_completed(self, download):
+        self.download_toast.show_completed(download)
+        self.status_bar.show_message(f"{tr('Download completed')}: {download.filename}")
+
+    @pyqtSlot(object)
+    def _on_download_failed(self, download):
+        self.status_bar.show_message(f"{tr('Download failed')}: {download.filename}")
+
     # ---- Menu ----
     def _show_menu(self):
+        if self.main_menu is None:
+            self._build_main_menu()
         self.main_menu.exec_(
             self.toolbar.menu_btn.mapToGlobal(self.toolbar.menu_btn.rect().bottomLeft())
         )
@@ -964,8 +1079,11 @@ body {{ background: #1e1e2e; color: #cdd6f4; font-family: 'Consolas', 'Courier N
         dialog.exec_()
 
     def _apply_settings(self, settings):
-        self.settings_manager.homepage = settings.get('homepage', DEFAULT_HOME_URL)
-        self.settings_manager.search_engine = settings.get('search_engine', 'Google')
+        # Only the keys that changed in the dialog are present; leave the rest alone
+        if 'homepage' in settings:
+            self.settings_manager.homepage = settings['homepage']
+        if 'search_engine' in settings:
+            self.settings_manager.search_engine = settings['search_engine']
         # Handle language change
         new_lang = settings.get('language')
         if new_lang and new_lang != self.settings_manager.language:
@@ -974,15 +1092,18 @@ body {{ background: #1e1e2e; color: #cdd6f4; font-family: 'Consolas', 'Courier N
             set_language(new_lang)
             # Rebuild menu and toolbar to reflect new language
             self._rebuild_ui_language()
-        if settings.get('dark_mode') != self._dark_mode:
+        if 'dark_mode' in settings and settings['dark_mode'] != self._dark_mode:
             self._toggle_dark_mode()
-        self.status_bar.setVisible(settings.get('show_status_bar', True))
-        self.settings_manager.show_status_bar = settings.get('show_status_bar', True)
-        self.settings_manager.ad_blocker_enabled = settings.get('ad_blocker', True)
-        if self.ad_blocker:
-            self.ad_blocker.set_enabled(settings.get('ad_blocker', True))
-        self.settings_manager.javascript_enabled = settings.get('javascript_enabled', True)
-        self.engine.set_javascript_enabled(settings.get('javascript_enabled', True))
+        if 'show_status_bar' in settings:
+            self.status_bar.setVisible(settings['show_status_bar'])
+            self.settings_manager.show_status_bar = settings['show_status_bar']
+        if 'ad_blocker' in settings:
+            self.settings_manager.ad_blocker_enabled = settings['ad_blocker']
+            if self.ad_blocker:
+                self.ad_blocker.set_enabled(settings['ad_blocker'])
+        if 'javascript_enabled' in settings:
+            self.settings_manager.javascript_enabled = settings['javascript_enabled']
+            self.engine.set_javascript_enabled(settings['javascript_enabled'])
         if settings.get('download_path'):
             self.settings_manager.download_path = settings.get('download_path')
             self.engine.set_download_path(settings.get('download_path'))
@@ -998,9 +1119,10 @@ body {{ background: #1e1e2e; color: #cdd6f4; font-family: 'Consolas', 'Courier N
 
     def _rebuild_ui_language(self):
         """Rebuild menu and toolbar tooltips to reflect language change."""
-        # Rebuild the main menu
-        self.main_menu.clear()
-        self._setup_menu()
+        # Drop the main menu; the next _show_menu() builds it in the new language
+        if self.main_menu is not None:
+            self.main_menu.deleteLater()
+            self.main_menu = None
 
         # Update toolbar tooltips
         self.toolbar.back_btn.setToolTip(tr("Back"))
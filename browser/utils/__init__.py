@@ -4,7 +4,7 @@ from .helpers import (
     generate_unique_filename, get_favicon_url, is_internal_page,
     truncate_text, get_file_extension, mime_type_to_extension,
     escape_html, get_resource_path, get_icon_path, load_icon,
-    url_encode, url_decode
+    url_encode, url_decode, json_dumps, json_loads
 )
 from .constants import (
     APP_NAME, APP_VERSION, APP_ORGANIZATION, APP_DOMAIN,
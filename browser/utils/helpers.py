@@ -1,5 +1,6 @@
 import os
 import re
+import json
 import hashlib
 import logging
 from datetime import datetime
@@ -8,6 +9,11 @@ from PyQt5.QtCore import QUrl
 from PyQt5.QtGui import QIcon, QColor
 from .constants import RESOURCES_DIR, ICONS_DIR
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 log = logging.getLogger(__name__)
 
 
@@ -19,12 +25,15 @@ def get_icon_path(name: str) -> str:
     return os.path.join(ICONS_DIR, name)
 
 
-def load_icon(name: str, color: str = None) -> QIcon:
-    path = get_icon_path(name)
-    if not os.path.exists(path):
-        return QIcon()
-    if color is None:
-        return QIcon(path)
+# Tinted SVG renders keyed by (icon name, stroke color); QIcon wraps these cheaply
+_pixmap_cache = {}
+
+
+def _tinted_pixmap(path: str, name: str, color: str):
+    key = (name, color)
+    pixmap = _pixmap_cache.get(key)
+    if pixmap is not None:
+        return pixmap
     with open(path, 'r', encoding='utf-8') as f:
         svg_data = f.read()
     svg_data = svg_data.replace('stroke="currentColor"', f'stroke="{color}"')
@@ -38,7 +47,17 @@ def load_icon(name: str, color: str = None) -> QIcon:
     painter = QPainter(pixmap)
     renderer.render(painter)
     painter.end()
-    return QIcon(pixmap)
+    _pixmap_cache[key] = pixmap
+    return pixmap
+
+
+def load_icon(name: str, color: str = None) -> QIcon:
+    path = get_icon_path(name)
+    if not os.path.exists(path):
+        return QIcon()
+    if color is None:
+        return QIcon(path)
+    return QIcon(_tinted_pixmap(path, name, color))
 
 
 def load_themed_icon(name: str, dark_mode: bool) -> QIcon:
@@ -177,3 +196,18 @@ def url_encode(text: str) -> str:
 
 def url_decode(text: str) -> str:
     return unquote(text)
+
+
+def json_dumps(obj, indent: bool = False) -> str:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+
+def json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -44,6 +44,11 @@ def _(text: str) -> str:
     return _translations.gettext(text)
 
 
+def N_(text: str) -> str:
+    """Mark a string for extraction (xgettext -k N_) without translating it yet."""
+    return text
+
+
 def get_current_language() -> str:
     """Get the current language code."""
     return _current_lang
@@ -0,0 +1,22 @@
+import pytest
+
+QtCore = pytest.importorskip("PyQt5.QtCore")
+search = pytest.importorskip("browser.features.search")
+
+
+@pytest.fixture(scope="module")
+def manager():
+    # Keep search.ini out of the real user config directory
+    QtCore.QStandardPaths.setTestModeEnabled(True)
+    return search.SearchManager()
+
+
+@pytest.mark.parametrize("text", ["chrome://gpu", "chrome://settings", "foo://bar"])
+def test_scheme_url_without_dot_is_navigated(manager, text):
+    assert manager.process_input(text) == (text, False)
+
+
+def test_plain_word_is_searched(manager):
+    url, is_search = manager.process_input("python")
+    assert is_search
+    assert url == manager.get_search_url("python")